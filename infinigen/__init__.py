@@ -3,11 +3,13 @@
 # This source code is licensed under the BSD 3-Clause license found in the LICENSE file in the root directory
 # of this source tree.
 
+import functools
 import logging
 from pathlib import Path
 
 __version__ = "1.8.1"
 
 
+@functools.cache
 def repo_root():
     return Path(__file__).parent.parent
@@ -3,6 +3,8 @@
 # of this source tree.
 
 import ast
+import functools
+import io
 import logging
 import os
 import random
@@ -37,17 +39,21 @@ CYCLES_GPUTYPES_PREFERENCE = [
     "ONEAPI",  # untested
     "CPU",
 ]
+_GPUTYPE_RANK = {t: i for i, t in enumerate(CYCLES_GPUTYPES_PREFERENCE)}
+
+_OVERRIDE_BADCHARS = frozenset("\"'[]")
 
 
 def parse_args_blender(parser):
-    if "--" in sys.argv:
-        # Running using a blender commandline python.
-        # args before '--' are intended for blender not infinigen
-        argvs = sys.argv[sys.argv.index("--") + 1 :]
-        return parser.parse_args(argvs)
-    else:
+    try:
+        i = sys.argv.index("--")
+    except ValueError:
         return parser.parse_args()
 
+    # Running using a blender commandline python.
+    # args before '--' are intended for blender not infinigen
+    return parser.parse_args(sys.argv[i + 1 :])
+
 
 def parse_seed(seed, task=None):
     if seed is None:
@@ -68,17 +74,34 @@ def parse_seed(seed, task=None):
     return int_hash(seed), "hashed string to integer"
 
 
+def reseed(scene_seed: int):
+    """
+    Reset the python and numpy global RNGs to `scene_seed`.
+
+    Unlike apply_scene_seed this does not touch gin, so it can be called repeatedly in one process,
+    e.g. to restore the RNG state between tiles rendered by the same worker.
+
+    The OVERALL_SEED gin constant (used by FixedSeed and every `%OVERALL_SEED` binding) can only be
+    registered once per process, so this should only re-apply the seed already passed to apply_scene_seed.
+    Passing a different seed leaves gin-driven seeding on the old value.
+    """
+    random.seed(scene_seed)
+
+    # Asset and placement code draws from the legacy global np.random state (see FixedSeed),
+    # so scene determinism relies on seeding it here rather than handing out a Generator
+    np.random.seed(scene_seed)
+
+
 def apply_scene_seed(seed, task=None):
     scene_seed, reason = parse_seed(seed, task)
     logger.info(f"Converted {seed=} to {scene_seed=}, {reason}")
     gin.constant("OVERALL_SEED", scene_seed)
-    random.seed(scene_seed)
-    np.random.seed(scene_seed)
+    reseed(scene_seed)
     return scene_seed
 
 
 def sanitize_override(override: list):
-    if ("=" in override) and not any((c in override) for c in "\"'[]"):
+    if ("=" in override) and _OVERRIDE_BADCHARS.isdisjoint(override):
         k, v = override.split("=")
         try:
             ast.literal_eval(v)
@@ -89,10 +112,62 @@ def sanitize_override(override: list):
     return override
 
 
+@functools.lru_cache
+def _cached_folder_stems(folder: Path, mtime_ns: int) -> frozenset[str]:
+    with os.scandir(folder) as it:
+        return frozenset(Path(entry.name).stem for entry in it)
+
+
+def _folder_stems(folder: Path) -> frozenset[str]:
+    # keyed on the folder mtime so that adding or removing files invalidates the cache
+    return _cached_folder_stems(folder, folder.stat().st_mtime_ns)
+
+
 def contained_stems(filenames: list[str], folder: Path):
+    """
+    Return True if any of `filenames` matches (by stem or name) an entry of `folder`
+    """
     assert folder.exists()
-    names = [p.stem for p in folder.iterdir()]
-    return {s.stem in names or s.name in names for s in map(Path, filenames)}
+    names = _folder_stems(folder)
+    return any(s.stem in names or s.name in names for s in map(Path, filenames))
+
+
+def _scan_gin_files(roots: list[Path]) -> dict[str, Path]:
+    """
+    Map each .gin file stem found anywhere under `roots` to its path.
+
+    Roots are walked in order with a single os.scandir pass each, and the first file found
+    for a given stem wins, so earlier roots take precedence over later ones.
+    """
+
+    found = {}
+    for root in roots:
+        stack = [root]
+        while stack:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".gin"):
+                        found.setdefault(entry.name[: -len(".gin")], Path(entry.path))
+    return found
+
+
+@functools.lru_cache
+def _read_gin(path: Path, mtime_ns: int) -> str:
+    # mtime_ns is only used as part of the cache key, so that edited files are re-read
+    return path.read_text()
+
+
+def _parse_gin_files_and_bindings(configs, bindings, skip_unknown, finalize_config):
+    # Equivalent to gin.parse_config_files_and_bindings, but file contents are cached across calls
+    for path in configs:
+        f = io.StringIO(_read_gin(path, path.stat().st_mtime_ns))
+        f.name = str(path)  # gin uses this to report error locations
+        gin.parse_config(f, skip_unknown=skip_unknown)
+    gin.parse_config(bindings, skip_unknown=skip_unknown)
+    if finalize_config:
+        gin.finalize()
 
 
 def resolve_folder_maybe_relative(folder, root):
@@ -149,27 +224,24 @@ def apply_gin_configs(
 
     root = infinigen.repo_root()
 
-    def find_config(p):
-        p = Path(p)
-        for folder_rel in config_folders:
-            folder = root / folder_rel
-
-            if not folder.exists():
-                raise ValueError(
-                    f"{apply_gin_configs.__name__} got bad {folder_rel=}, {folder=} did not exist"
-                )
-
-            for file in folder.glob("**/*.gin"):
-                if file.stem == p.stem:
-                    logger.debug(f"Resolved {p} to file {file}")
-                    return file
-            logger.debug(f"Could not find {p} in {folder}")
+    search_paths = []
+    for folder_rel in config_folders:
+        folder = root / folder_rel
+        if not folder.exists():
+            raise ValueError(
+                f"{apply_gin_configs.__name__} got bad {folder_rel=}, {folder=} did not exist"
+            )
+        search_paths.append(folder)
+    gin_files = _scan_gin_files(search_paths)
 
+    stems = [Path(p).stem for p in ["base.gin"] + configs]
+    missing = [s for s in stems if s not in gin_files]
+    if missing:
         raise FileNotFoundError(
-            f"Could not find {p} or {p.stem} in any of {config_folders}"
+            f"Could not find configs {missing} in any of {config_folders}"
         )
-
-    configs = [find_config(g) for g in ["base.gin"] + configs]
+    configs = [gin_files[s] for s in stems]
+    logger.debug(f"Resolved configs to {configs}")
     overrides = [sanitize_override(o) for o in overrides]
 
     for mandatory_folder in mandatory_folders:
@@ -179,18 +251,22 @@ def apply_gin_configs(
                 f"At least one config file must be loaded from {mandatory_folder} to avoid unexpected behavior"
             )
 
+    config_stems = {s.stem for s in configs}
     for mutex_folder in mutually_exclusive_folders:
         mutex_folder = resolve_folder_maybe_relative(mutex_folder, root)
-        stems = {s.stem for s in mutex_folder.iterdir()}
-        config_stems = {s.stem for s in configs}
-        both = stems.intersection(config_stems)
-        if len(both) > 1:
-            raise ValueError(
-                f"At most one config file must be loaded from {mutex_folder} to avoid unexpected behavior, instead got {both=}"
-            )
+        stems = _folder_stems(mutex_folder)
+        both = []
+        for s in config_stems:
+            if s not in stems:
+                continue
+            both.append(s)
+            if len(both) > 1:
+                raise ValueError(
+                    f"At most one config file must be loaded from {mutex_folder} to avoid unexpected behavior, instead got {both=}"
+                )
 
     with LogLevel(logger=logging.getLogger(), level=logging.WARNING):
-        gin.parse_config_files_and_bindings(
+        _parse_gin_files_and_bindings(
             configs,
             bindings=overrides,
             skip_unknown=skip_unknown,
@@ -199,12 +275,22 @@ def apply_gin_configs(
 
 
 def import_addons(names):
-    for name in names:
-        try:
-            with Suppress():
+    enabled = bpy.context.preferences.addons.keys()
+    names = [name for name in names if name not in enabled]
+    if not names:
+        return
+
+    # Suppress() also disables logging, so failures are reported once it exits
+    failed = []
+    with Suppress():
+        for name in names:
+            try:
                 bpy.ops.preferences.addon_enable(module=name)
-        except Exception:
-            logger.warning(f'Could not load addon "{name}"')
+            except Exception:
+                failed.append(name)
+
+    for name in failed:
+        logger.warning(f'Could not load addon "{name}"')
 
 
 @gin.configurable
@@ -217,68 +303,95 @@ def configure_render_cycles(
     exposure,
     denoise,
 ):
-    bpy.context.scene.render.engine = "CYCLES"
+    scene = bpy.context.scene
+    cycles = scene.cycles
+    scene.render.engine = "CYCLES"
 
     # For now, denoiser is always turned on, but the  _used_
-    bpy.context.scene.cycles.use_denoising = denoise
+    cycles.use_denoising = denoise
     if denoise:
         try:
-            bpy.context.scene.cycles.denoiser = "OPTIX"
+            cycles.denoiser = "OPTIX"
         except Exception as e:
             logger.warning(f"Cannot use OPTIX denoiser {e}")
 
-    bpy.context.scene.cycles.samples = num_samples  # i.e. infinity
-    bpy.context.scene.cycles.adaptive_min_samples = min_samples
-    bpy.context.scene.cycles.adaptive_threshold = (
-        adaptive_threshold  # i.e. noise threshold
+    cycles.samples = num_samples  # i.e. infinity
+    cycles.adaptive_min_samples = min_samples
+    cycles.adaptive_threshold = adaptive_threshold  # i.e. noise threshold
+    cycles.time_limit = time_limit
+    cycles.film_exposure = exposure
+    cycles.volume_step_rate = 0.1
+    cycles.volume_preview_step_rate = 0.1
+    cycles.volume_max_steps = 32
+    cycles.volume_bounces = 4
+
+
+# compute_device_type picked by the first configure_cycles_devices() call, reused by later scene setups.
+# Only the type is cached: prefs.devices entries are invalidated whenever cycles resizes the collection
+_cached_device_type: str | None = None
+
+
+def _probe_cycles_device_type(prefs):
+    # Query device types in preference order and stop at the first one with any devices,
+    # rather than enumerating devices for every backend the cycles build knows about.
+    # Backends missing from CYCLES_GPUTYPES_PREFERENCE are tried last instead of raising
+    types = {dt[0] for dt in prefs.get_device_types(bpy.context)}
+    types -= {"NONE", "CPU"}
+    types = sorted(
+        types, key=lambda t: _GPUTYPE_RANK.get(t, len(CYCLES_GPUTYPES_PREFERENCE))
     )
-    bpy.context.scene.cycles.time_limit = time_limit
-    bpy.context.scene.cycles.film_exposure = exposure
-    bpy.context.scene.cycles.volume_step_rate = 0.1
-    bpy.context.scene.cycles.volume_preview_step_rate = 0.1
-    bpy.context.scene.cycles.volume_max_steps = 32
-    bpy.context.scene.cycles.volume_bounces = 4
+    logger.info(f"Cycles supports device {types=}")
+
+    for device_type in types:
+        try:
+            devices = prefs.get_devices_for_type(device_type)
+        except Exception as e:
+            logger.debug(f"Could not query cycles devices for {device_type=}: {e}")
+            continue
+        if any(d.type == device_type for d in devices):
+            return device_type
+    return "CPU"
 
 
 @gin.configurable
 def configure_cycles_devices(use_gpu=True):
+    global _cached_device_type
+
+    scene = bpy.context.scene
+    cycles = scene.cycles
+
     if use_gpu is False:
         logger.info(f"Render will use CPU-only due to {use_gpu=}")
-        bpy.context.scene.cycles.device = "CPU"
+        cycles.device = "CPU"
         return
 
-    assert bpy.context.scene.render.engine == "CYCLES"
-    bpy.context.scene.cycles.device = "GPU"
+    assert scene.render.engine == "CYCLES"
+    cycles.device = "GPU"
     prefs = bpy.context.preferences.addons["cycles"].preferences
 
-    # Necessary to "remind" cycles that the devices exist? Not sure. Without this no devices are found.
-    for dt in prefs.get_device_types(bpy.context):
-        prefs.get_devices_for_type(dt[0])
-
-    assert len(prefs.devices) != 0, prefs.devices
-
-    types = list(d.type for d in prefs.devices)
+    if _cached_device_type is not None:
+        use_device_type = _cached_device_type
+        if use_device_type == "CPU":
+            cycles.device = "CPU"
+            return
+        prefs.compute_device_type = use_device_type
+        return [d for d in prefs.devices if d.type == use_device_type]
 
-    types = sorted(types, key=CYCLES_GPUTYPES_PREFERENCE.index)
-    logger.info(f"Available devices have {types=}")
-    use_device_type = types[0]
+    use_device_type = _probe_cycles_device_type(prefs)
+    _cached_device_type = use_device_type
 
     if use_device_type == "CPU":
-        logger.warning(f"Render will use CPU-only, only found {types=}")
-        bpy.context.scene.cycles.device = "CPU"
+        logger.warning("Render will use CPU-only, found no GPU devices")
+        cycles.device = "CPU"
         return
 
-    bpy.context.preferences.addons[
-        "cycles"
-    ].preferences.compute_device_type = use_device_type
+    prefs.compute_device_type = use_device_type
     use_devices = [d for d in prefs.devices if d.type == use_device_type]
 
     logger.info(f"Cycles will use {use_device_type=}, {len(use_devices)=}")
 
     for d in prefs.devices:
-        d.use = False
-    for d in use_devices:
-        d.use = True
+        d.use = d.type == use_device_type
 
     return use_devices
 
@@ -289,8 +402,9 @@ def configure_blender(
     motion_blur=False,
     motion_blur_shutter=0.5,
 ):
-    bpy.context.preferences.system.scrollback = 0
-    bpy.context.preferences.edit.undo_steps = 0
+    prefs = bpy.context.preferences
+    prefs.system.scrollback = 0
+    prefs.edit.undo_steps = 0
 
     if render_engine == "CYCLES":
         configure_render_cycles()
@@ -298,9 +412,11 @@ def configure_blender(
     else:
         raise ValueError(f"Unrecognized {render_engine=}")
 
-    bpy.context.scene.render.use_motion_blur = motion_blur
+    scene = bpy.context.scene
+    render = scene.render
+    render.use_motion_blur = motion_blur
     if motion_blur:
-        bpy.context.scene.cycles.motion_blur_position = "START"
-        bpy.context.scene.render.motion_blur_shutter = motion_blur_shutter
+        scene.cycles.motion_blur_position = "START"
+        render.motion_blur_shutter = motion_blur_shutter
 
     import_addons(["ant_landscape", "real_snow"])
@@ -31,6 +31,7 @@ from infinigen.core.placement import camera as cam_util
 from infinigen.core.placement import placement
 from infinigen.core.placement.split_in_view import split_inview
 from infinigen.core.util import blender as butil
+from infinigen.core.util.organization import Task
 from infinigen.terrain import Terrain
 
 logging.basicConfig(
@@ -214,7 +215,7 @@ def main():
         "-g",
         "--configs",
         nargs="+",
-        default=["base"],
+        default=["base", "forest"],
         help="Set of config files for gin (separated by spaces) "
         "e.g. --configs file1 file2 (exclude .gin from path)",
     )
@@ -250,11 +251,18 @@ def main():
     logging.getLogger("infinigen").setLevel(args.loglevel)
 
     scene_seed = init.apply_scene_seed(args.seed, task=args.task)
+
+    # render-only tasks on an existing scene do not need a scene type
+    generates_scene = any(
+        t in args.task for t in [Task.Coarse, Task.Populate, Task.FineTerrain]
+    )
     init.apply_gin_configs(
         configs=args.configs,
         overrides=args.overrides,
         config_folders=["infinigen_examples/configs_nature"],
-        mandatory_folders=["infinigen_examples/configs_nature/scene_types"],
+        mandatory_folders=["infinigen_examples/configs_nature/scene_types"]
+        if generates_scene
+        else [],
         skip_unknown=True,
     )
 
@@ -956,11 +956,16 @@ def populate_scene(output_folder, scene_seed, **params):
 def main(args):
     scene_seed = init.apply_scene_seed(args.seed)
     mandatory_exclusive = [Path("infinigen_examples/configs_nature/scene_types")]
+
+    # render-only tasks (e.g. rendering an indoors scene, see docs/HelloRoom.md) do not need a scene type
+    generates_scene = any(
+        t in args.task for t in [Task.Coarse, Task.Populate, Task.FineTerrain]
+    )
     init.apply_gin_configs(
         configs=["base_nature.gin"] + args.configs,
         overrides=args.overrides,
         config_folders="infinigen_examples/configs_nature",
-        mandatory_folders=mandatory_exclusive,
+        mandatory_folders=mandatory_exclusive if generates_scene else [],
         mutually_exclusive_folders=mandatory_exclusive,
     )
 
@@ -0,0 +1,104 @@
+# Copyright (C) 2024, Princeton University.
+# This source code is licensed under the BSD 3-Clause license found in the LICENSE file in the root directory
+# of this source tree.
+
+import os
+import random
+
+import gin
+import numpy as np
+import pytest
+
+import infinigen
+from infinigen.core.init import (
+    _scan_gin_files,
+    apply_gin_configs,
+    contained_stems,
+    reseed,
+)
+
+
+def test_contained_stems(tmp_path):
+    (tmp_path / "forest.gin").touch()
+    (tmp_path / "desert.gin").touch()
+
+    assert contained_stems(["base.gin", "forest.gin"], tmp_path)
+    assert contained_stems(["/some/other/folder/desert.gin"], tmp_path)
+    assert not contained_stems(["base.gin", "arctic.gin"], tmp_path)
+    assert not contained_stems([], tmp_path)
+
+
+def test_mandatory_folder_missing():
+    folder = infinigen.repo_root() / "infinigen/datagen/configs"
+    with pytest.raises(FileNotFoundError, match="At least one config file"):
+        apply_gin_configs(
+            config_folders=folder,
+            configs=["monocular.gin"],
+            mandatory_folders=[folder / "compute_platform"],
+        )
+
+
+def test_reseed_reproducible():
+    reseed(1234)
+    first = (random.random(), np.random.uniform())
+    reseed(1234)
+    assert (random.random(), np.random.uniform()) == first
+
+
+def _bump_mtime(path):
+    # make sure mtime-keyed caches see a change even on filesystems with coarse timestamps
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+def test_edited_gin_is_reparsed(tmp_path):
+    gin_file = tmp_path / "base.gin"
+
+    gin_file.write_text("configure_blender.motion_blur = False\n")
+    gin.clear_config()
+    apply_gin_configs(config_folders=tmp_path)
+    assert gin.query_parameter("configure_blender.motion_blur") is False
+
+    gin_file.write_text("configure_blender.motion_blur = True\n")
+    _bump_mtime(gin_file)
+    gin.clear_config()
+    apply_gin_configs(config_folders=tmp_path)
+    assert gin.query_parameter("configure_blender.motion_blur") is True
+
+
+def test_mutex_folder_sees_new_file(tmp_path):
+    (tmp_path / "base.gin").touch()
+    (tmp_path / "second.gin").touch()
+    mutex = tmp_path / "mutex"
+    mutex.mkdir()
+    (mutex / "first.gin").touch()
+
+    gin.clear_config()
+    apply_gin_configs(
+        config_folders=tmp_path,
+        configs=["first.gin", "second.gin"],
+        mutually_exclusive_folders=[mutex],
+    )
+
+    (mutex / "second.gin").touch()
+    _bump_mtime(mutex)
+    gin.clear_config()
+    with pytest.raises(ValueError, match="At most one config file"):
+        apply_gin_configs(
+            config_folders=tmp_path,
+            configs=["first.gin", "second.gin"],
+            mutually_exclusive_folders=[mutex],
+        )
+
+
+def test_scan_gin_files_earlier_root_wins(tmp_path):
+    first, second = tmp_path / "first", tmp_path / "second"
+    (first / "nested").mkdir(parents=True)
+    second.mkdir()
+    (first / "nested" / "shared.gin").touch()
+    (second / "shared.gin").touch()
+    (second / "other.gin").touch()
+
+    found = _scan_gin_files([first, second])
+    assert found["shared"] == first / "nested" / "shared.gin"
+    assert found["other"] == second / "other.gin"